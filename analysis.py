@@ -1,17 +1,60 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+def _evolution_axes(title):
+    # Setup grafik bersama untuk plot_evolution dan plot_evolution_stream
+    fig, ax = plt.subplots(figsize=(10, 6))
+    best_line, = ax.plot([], [], label='Best Sharpe Ratio')
+    avg_line, = ax.plot([], [], label='Average Sharpe Ratio', linestyle='--')
+    ax.set_xlabel('Generasi')
+    ax.set_ylabel('Sharpe Ratio')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    return ax, best_line, avg_line
+
+def _update_evolution_axes(ax, best_line, avg_line, gens, best, avg):
+    best_line.set_data(gens, best)
+    avg_line.set_data(gens, avg)
+    ax.relim()
+    ax.autoscale_view()
+
 def plot_evolution(best_fitness, avg_fitness):
-    plt.figure(figsize=(10, 6))
-    plt.plot(best_fitness, label='Best Sharpe Ratio')
-    plt.plot(avg_fitness, label='Average Sharpe Ratio', linestyle='--')
-    plt.xlabel('Generasi')
-    plt.ylabel('Sharpe Ratio')
-    plt.title('Perkembangan Sharpe Ratio')
-    plt.legend()
-    plt.grid(True)
+    ax, best_line, avg_line = _evolution_axes('Perkembangan Sharpe Ratio')
+    _update_evolution_axes(ax, best_line, avg_line, range(len(best_fitness)), best_fitness, avg_fitness)
+    plt.tight_layout()
+    plt.show()
+
+def plot_evolution_stream(snapshots, refresh_every=10):
+    """
+    Grafik evolusi yang diperbarui langsung dari GeneticAlgorithm.stream().
+    Grafik digambar ulang tiap 'refresh_every' generasi agar tidak memperlambat GA.
+    Ctrl+C menghentikan run; grafik tetap digambar dengan hasil sementara.
+    Mengembalikan snapshot dengan fitness terbaik.
+    """
+    plt.ion()
+    ax, best_line, avg_line = _evolution_axes('Perkembangan Sharpe Ratio (Live)')
+
+    gens, best, avg = [], [], []
+    best_snap = None
+    try:
+        for snap in snapshots:
+            gens.append(snap.generation - 1)
+            best.append(snap.best_fitness)
+            avg.append(snap.avg_fitness)
+            if best_snap is None or snap.best_fitness > best_snap.best_fitness:
+                best_snap = snap
+            if snap.generation % refresh_every == 0:
+                _update_evolution_axes(ax, best_line, avg_line, gens, best, avg)
+                plt.pause(0.001)
+    except KeyboardInterrupt:
+        print("\n⏹️ Run dihentikan, menampilkan hasil sementara.")
+
+    _update_evolution_axes(ax, best_line, avg_line, gens, best, avg)
+    plt.ioff()
     plt.tight_layout()
     plt.show()
+    return best_snap
 
 
 def display_allocation(weights, tickers, initial_investment=100_000_000):
@@ -28,6 +71,24 @@ def display_history(best_fitness, avg_fitness):
     for i, (best, avg) in enumerate(zip(best_fitness, avg_fitness)):
         print(f"Gen {i+1:3d}: Best = {best:.4f}, Avg = {avg:.4f}")
 
+def display_history_stream(snapshots):
+    """
+    Cetak riwayat Sharpe Ratio satu per satu saat snapshot dari GA tiba.
+    Mengembalikan snapshot dengan fitness terbaik tanpa menyimpan seluruh riwayat.
+    Ctrl+C menghentikan run dan mengembalikan snapshot terbaik sejauh ini.
+    """
+    print("\n=== Riwayat Sharpe Ratio (Live) ===")
+    best_snap = None
+    try:
+        for snap in snapshots:
+            print(f"Gen {snap.generation:3d}: Best = {snap.best_fitness:.4f}, "
+                  f"Avg = {snap.avg_fitness:.4f} ({snap.elapsed:.2f}s)")
+            if best_snap is None or snap.best_fitness > best_snap.best_fitness:
+                best_snap = snap
+    except KeyboardInterrupt:
+        print("\n⏹️ Run dihentikan, menampilkan hasil sementara.")
+    return best_snap
+
 def display_weights_by_generation(best_solutions):
     try:
         gen = int(input(f"Masukkan nomor generasi (1 - {len(best_solutions)}): "))
@@ -1,4 +1,5 @@
 import random
+import time
 import numpy as np
 from deap import base, creator, tools, algorithms
 
@@ -26,6 +27,11 @@ ALPHA = 1.0
 BETA = 0.05
 GAMMA = 2.0
 
+# Mode optimasi: 'weighted' (skalar ALPHA/BETA/GAMMA) atau 'nsga2' (Pareto front)
+MODE = 'weighted'
+NSGA2_POP_SIZE = 200
+NSGA2_GENERATIONS = 100
+
 # ==== GA Setup ====
 total_genes = sum(NUM_MACHINES.values())
 
@@ -66,8 +72,151 @@ toolbox.register("mate", tools.cxBlend, alpha=0.5)
 toolbox.register("mutate", tools.mutGaussian, mu=8, sigma=5, indpb=0.2)
 toolbox.register("select", tools.selTournament, tournsize=3)
 
-def run_ga():
-    pop = toolbox.population(n=100)
+# ==== NSGA-II Setup (multi-objektif) ====
+# Objektif: maksimasi output, minimasi energi, minimasi emisi
+creator.create("FitnessMulti", base.Fitness, weights=(1.0, -1.0, -1.0))
+creator.create("IndividualMulti", list, fitness=creator.FitnessMulti)
+
+# Vektor parameter per gen agar evaluasi cukup satu perkalian dot
+GENE_OUTPUT = np.repeat([MACHINE_PARAMS[m]['output'] for m in NUM_MACHINES], list(NUM_MACHINES.values()))
+GENE_ENERGY = np.repeat([MACHINE_PARAMS[m]['energy'] for m in NUM_MACHINES], list(NUM_MACHINES.values()))
+GENE_EMISSION = np.repeat([MACHINE_PARAMS[m]['emission'] for m in NUM_MACHINES], list(NUM_MACHINES.values()))
+
+def evaluate_multi(individual):
+    hours = np.asarray(individual)
+    return (float(GENE_OUTPUT @ hours), float(GENE_ENERGY @ hours), float(GENE_EMISSION @ hours))
+
+mo_toolbox = base.Toolbox()
+mo_toolbox.register("individual", tools.initRepeat, creator.IndividualMulti, toolbox.attr_hours, n=total_genes)
+mo_toolbox.register("population", tools.initRepeat, list, mo_toolbox.individual)
+mo_toolbox.register("evaluate", evaluate_multi)
+# Operator berbatas agar jam kerja tetap di rentang [0, MAX_WORK_HOURS]
+mo_toolbox.register("mate", tools.cxSimulatedBinaryBounded, low=0, up=MAX_WORK_HOURS, eta=20.0)
+mo_toolbox.register("mutate", tools.mutPolynomialBounded, low=0, up=MAX_WORK_HOURS, eta=20.0, indpb=1.0 / total_genes)
+
+def constraint_violation(objectives):
+    """
+    Total pelanggaran batas energi dan emisi untuk matriks objektif (N x 3).
+    """
+    energy_excess = np.maximum(0, objectives[:, 1] - TOTAL_ENERGY_CAP)
+    emission_excess = np.maximum(0, objectives[:, 2] - EMISSION_CAP)
+    return energy_excess + emission_excess
+
+def fast_non_dominated_sort(individuals, violation=None):
+    """
+    Non-dominated sorting dengan tools.sortLogNondominated milik DEAP
+    (Fortin et al., 2013): O(N log^(M-1) N) tanpa matriks dominasi N x N.
+    - individuals: list individu dengan fitness yang sudah dievaluasi
+    - violation  : pelanggaran constraint per individu (opsional); solusi
+                   feasible selalu mendominasi yang tidak feasible
+    Mengembalikan array rank (0 = front Pareto pertama).
+    """
+    n = len(individuals)
+    if violation is None:
+        violation = np.zeros(n)
+    ranks = np.zeros(n, dtype=int)
+
+    # Solusi feasible: sort Pareto pada wvalues (tanda objektif sudah diatur FitnessMulti)
+    feasible = np.flatnonzero(violation <= 0)
+    if feasible.size:
+        feasible_inds = [individuals[i] for i in feasible]
+        fronts = tools.sortLogNondominated(feasible_inds, len(feasible_inds), first_front_only=False)
+        rank_by_id = {id(ind): rank for rank, front in enumerate(fronts) for ind in front}
+        ranks[feasible] = [rank_by_id[id(ind)] for ind in feasible_inds]
+
+    # Solusi infeasible: pelanggaran lebih kecil selalu mendominasi, jadi rank = urutan pelanggaran
+    infeasible = np.flatnonzero(violation > 0)
+    if infeasible.size:
+        offset = ranks[feasible].max() + 1 if feasible.size else 0
+        _, level = np.unique(violation[infeasible], return_inverse=True)
+        ranks[infeasible] = offset + level.ravel()
+    return ranks
+
+def crowding_distance(objectives, ranks):
+    """
+    Crowding distance per individu, dihitung terpisah untuk setiap front.
+    Titik ujung front mendapat jarak tak hingga.
+    """
+    n, m = objectives.shape
+    distance = np.zeros(n)
+    for rank in np.unique(ranks):
+        members = np.flatnonzero(ranks == rank)
+        if members.size <= 2:
+            distance[members] = np.inf
+            continue
+        front = objectives[members]
+        order = np.argsort(front, axis=0)
+        sorted_vals = np.take_along_axis(front, order, axis=0)
+        span = sorted_vals[-1] - sorted_vals[0]
+        span[span == 0] = 1.0
+        gaps = np.zeros_like(sorted_vals)
+        gaps[1:-1] = (sorted_vals[2:] - sorted_vals[:-2]) / span
+        gaps[0] = gaps[-1] = np.inf
+        contrib = np.zeros_like(gaps)
+        np.put_along_axis(contrib, order, gaps, axis=0)
+        distance[members] = contrib.sum(axis=1)
+    return distance
+
+def _rank_population(pop):
+    # Ubah nilai fitness menjadi bentuk minimasi (output dinegasikan)
+    values = np.array([ind.fitness.values for ind in pop])
+    objectives = values * -np.array(creator.FitnessMulti.weights)
+    ranks = fast_non_dominated_sort(pop, constraint_violation(values))
+    return ranks, crowding_distance(objectives, ranks)
+
+def _binary_tournament(pop, ranks, distance, k):
+    # Crowded-comparison: rank lebih kecil menang, seri dipecah oleh crowding terbesar
+    # Pakai modul random (bukan np.random) agar seed random.seed() cukup untuk seluruh run
+    a = np.array([random.randrange(len(pop)) for _ in range(k)])
+    b = np.array([random.randrange(len(pop)) for _ in range(k)])
+    a_wins = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (distance[a] >= distance[b]))
+    return [pop[i] for i in np.where(a_wins, a, b)]
+
+def run_nsga2(pop_size=NSGA2_POP_SIZE, ngen=NSGA2_GENERATIONS, cxpb=0.9, verbose=True):
+    """
+    Menjalankan NSGA-II dan mengembalikan Pareto front (output, energi, emisi)
+    dalam satu kali run, tanpa perlu menyetel ALPHA/BETA/GAMMA.
+    """
+    pop = mo_toolbox.population(n=pop_size)
+    for ind in pop:
+        ind.fitness.values = mo_toolbox.evaluate(ind)
+    ranks, distance = _rank_population(pop)
+
+    for gen in range(ngen):
+        parents = _binary_tournament(pop, ranks, distance, pop_size)
+        offspring = [mo_toolbox.clone(ind) for ind in parents]
+
+        for child1, child2 in zip(offspring[::2], offspring[1::2]):
+            if random.random() < cxpb:
+                mo_toolbox.mate(child1, child2)
+        for child in offspring:
+            mo_toolbox.mutate(child)
+            child.fitness.values = mo_toolbox.evaluate(child)
+
+        # Seleksi lingkungan: gabungan parent + offspring, urut rank lalu crowding
+        combined = pop + offspring
+        ranks, distance = _rank_population(combined)
+        survivors = np.lexsort((-distance, ranks))[:pop_size]
+        pop = [combined[i] for i in survivors]
+        ranks, distance = ranks[survivors], distance[survivors]
+
+        if verbose:
+            print(f"Gen {gen + 1:3d}: Front 1 = {int(np.sum(ranks == 0))} solusi")
+
+    # Buang individu dengan vektor objektif yang sama agar tiap titik front muncul sekali
+    front = [ind for ind, r in zip(pop, ranks) if r == 0]
+    values = np.round([ind.fitness.values for ind in front], 6)
+    _, unique_idx = np.unique(values, axis=0, return_index=True)
+    front = [front[i] for i in unique_idx]
+    return sorted(front, key=lambda ind: ind.fitness.values[0])
+
+def stream_ga(pop_size=100, cxpb=0.5, mutpb=0.3, ngen=50):
+    """
+    Generator versi eaSimple: meng-yield (record, best) tiap generasi, dengan
+    record berisi statistik generasi dan best individu terbaik sejauh ini.
+    Generasi berikutnya baru dihitung saat diminta, jadi bisa dihentikan dengan break.
+    """
+    pop = toolbox.population(n=pop_size)
     hof = tools.HallOfFame(1)
 
     stats = tools.Statistics(lambda ind: ind.fitness.values)
@@ -75,10 +224,33 @@ def run_ga():
     stats.register("max", np.max)
     stats.register("min", np.min)
 
-    pop, log = algorithms.eaSimple(pop, toolbox, cxpb=0.5, mutpb=0.3, ngen=50,
-                                   stats=stats, halloffame=hof, verbose=True)
+    compute_time = 0.0
+    for gen in range(ngen + 1):
+        t0 = time.perf_counter()
+        if gen > 0:
+            pop = toolbox.select(pop, len(pop))
+            pop = algorithms.varAnd(pop, toolbox, cxpb, mutpb)
+
+        invalid_ind = [ind for ind in pop if not ind.fitness.valid]
+        for ind, fit in zip(invalid_ind, map(toolbox.evaluate, invalid_ind)):
+            ind.fitness.values = fit
+        hof.update(pop)
+
+        record = stats.compile(pop)
+        # elapsed = waktu komputasi GA kumulatif, tanpa waktu konsumen di antara generasi
+        compute_time += time.perf_counter() - t0
+        record.update(gen=gen, nevals=len(invalid_ind), elapsed=compute_time)
+        yield record, hof[0]
 
-    return hof[0], log
+def run_ga():
+    log = tools.Logbook()
+    log.header = ['gen', 'nevals', 'avg', 'max', 'min']
+
+    for record, best in stream_ga():
+        log.record(**{k: record[k] for k in log.header})
+        print(log.stream)
+
+    return best, log
 
 # Tambahan fungsi: interpretasi hasil terbaik
 def interpret_solution(individual):
@@ -117,22 +289,32 @@ def interpret_solution(individual):
 
     return summary
 
-# Jalankan algoritma
-best_ind, logbook = run_ga()
-
-# Interpretasi hasil terbaik
-result = interpret_solution(best_ind)
-
-# === Rangkuman Ringkas ===
-print("\n=== RANGKUMAN PORTOFOLIO MESIN ===")
-print(f"Total Output   : {round(result['total_output'], 2)} unit produksi")
-print(f"Total Energi   : {round(result['total_energy'], 2)} kWh")
-print(f"Total Emisi    : {round(result['total_emission'], 2)} kg CO2")
-print(f"Fitness Score  : {round(best_ind.fitness.values[0], 2)}")
-
-# === Detail per Tipe Mesin ===
-print("\n=== DETAIL MESIN PER TIPE ===")
-for mtype, mesin_list in result['by_type'].items():
-    print(f"\nTipe Mesin {mtype} ({len(mesin_list)} unit):")
-    for mesin in mesin_list:
-        print(f"  {mesin['id']}: {mesin['hours']} jam | Output: {mesin['output']} | Energi: {mesin['energy']} | Emisi: {mesin['emission']}")
+if MODE == 'nsga2':
+    pareto_front = run_nsga2()
+
+    print("\n=== PARETO FRONT (OUTPUT / ENERGI / EMISI) ===")
+    for i, ind in enumerate(pareto_front, 1):
+        output, energy, emission = ind.fitness.values
+        feasible = energy <= TOTAL_ENERGY_CAP and emission <= EMISSION_CAP
+        print(f"  #{i:3d}: Output: {round(output, 2)} | Energi: {round(energy, 2)} | Emisi: {round(emission, 2)}"
+              f"{'' if feasible else ' (melewati batas)'}")
+else:
+    # Jalankan algoritma
+    best_ind, logbook = run_ga()
+
+    # Interpretasi hasil terbaik
+    result = interpret_solution(best_ind)
+
+    # === Rangkuman Ringkas ===
+    print("\n=== RANGKUMAN PORTOFOLIO MESIN ===")
+    print(f"Total Output   : {round(result['total_output'], 2)} unit produksi")
+    print(f"Total Energi   : {round(result['total_energy'], 2)} kWh")
+    print(f"Total Emisi    : {round(result['total_emission'], 2)} kg CO2")
+    print(f"Fitness Score  : {round(best_ind.fitness.values[0], 2)}")
+
+    # === Detail per Tipe Mesin ===
+    print("\n=== DETAIL MESIN PER TIPE ===")
+    for mtype, mesin_list in result['by_type'].items():
+        print(f"\nTipe Mesin {mtype} ({len(mesin_list)} unit):")
+        for mesin in mesin_list:
+            print(f"  {mesin['id']}: {mesin['hours']} jam | Output: {mesin['output']} | Energi: {mesin['energy']} | Emisi: {mesin['emission']}")
@@ -1,8 +1,21 @@
+import asyncio
+import time
+from collections import namedtuple
+
 import numpy as np
 import random
 from utils import normalize, crossover, mutate
 from constraints import is_valid
 
+# Ringkasan ringan satu generasi yang di-yield oleh GeneticAlgorithm.stream()
+GenerationSnapshot = namedtuple(
+    "GenerationSnapshot",
+    ["generation", "best_fitness", "avg_fitness", "best_weights", "best_return", "best_vol", "elapsed"]
+)
+
+# Penanda akhir stream untuk astream() (next() di thread tidak boleh melempar StopIteration)
+_SENTINEL = object()
+
 class GeneticAlgorithm:
     def __init__(self, exp_returns, cov_matrix, rf_rate=0.02, pop_size=50, generations=100, alpha=1.0, beta=1.0):
         """
@@ -67,25 +80,37 @@ class GeneticAlgorithm:
         selected = random.sample(list(zip(pop, fitnesses)), k)
         return max(selected, key=lambda x: x[1])[0]
 
-    def run(self):
+    def stream(self):
         """
-        Fungsi utama yang menjalankan proses evolusi dari algoritma genetika.
+        Generator yang menjalankan evolusi dan meng-yield GenerationSnapshot tiap generasi.
+        Generasi berikutnya baru dihitung saat konsumen meminta snapshot baru (back-pressure),
+        dan riwayat tidak disimpan sehingga memori tetap konstan. Hentikan lebih awal cukup
+        dengan keluar dari loop (break).
+        'elapsed' adalah waktu komputasi GA kumulatif (evaluasi + pembentukan generasi),
+        tidak termasuk waktu yang dipakai konsumen untuk memproses snapshot.
         """
+        t0 = time.perf_counter()
         pop = self.init_population()  # Populasi awal
+        compute_time = 0.0
 
         for gen in range(self.generations):
             # Hitung nilai fitness seluruh populasi
             fitnesses = [self.fitness(ind) for ind in pop]
             best_idx = np.argmax(fitnesses)
             best_sol = pop[best_idx]
-            best_fit = fitnesses[best_idx]
 
-            # Simpan data perkembangan generasi
-            self.best_fitness.append(best_fit)
-            self.avg_fitness.append(np.mean(fitnesses))
-            self.best_solutions.append(best_sol)
-            self.best_returns.append(np.dot(best_sol, self.exp_returns))
-            self.best_vols.append(np.sqrt(np.dot(best_sol.T, np.dot(self.cov_matrix, best_sol))))
+            snapshot = GenerationSnapshot(
+                generation=gen + 1,
+                best_fitness=fitnesses[best_idx],
+                avg_fitness=np.mean(fitnesses),
+                best_weights=best_sol,
+                best_return=np.dot(best_sol, self.exp_returns),
+                best_vol=np.sqrt(np.dot(best_sol.T, np.dot(self.cov_matrix, best_sol))),
+                elapsed=compute_time + time.perf_counter() - t0,
+            )
+            compute_time = snapshot.elapsed
+            yield snapshot
+            t0 = time.perf_counter()
 
             # Seleksi elit: 2 individu terbaik langsung masuk generasi berikutnya
             elite_count = 2
@@ -112,6 +137,46 @@ class GeneticAlgorithm:
 
             # Ganti populasi lama
             pop = new_pop
+            compute_time += time.perf_counter() - t0
+            t0 = time.perf_counter()
+
+    async def astream(self):
+        """
+        Versi async dari stream(): tiap generasi dihitung di thread terpisah
+        (asyncio.to_thread) sehingga event loop tetap bebas untuk task lain.
+        Generasi berikutnya baru dijadwalkan saat konsumen meminta snapshot baru.
+        Jika konsumen dibatalkan, generasi yang sedang berjalan ditunggu selesai
+        sebelum stream ditutup, lalu CancelledError diteruskan.
+        """
+        it = self.stream()
+        step = None
+        try:
+            while True:
+                step = asyncio.ensure_future(asyncio.to_thread(next, it, _SENTINEL))
+                snapshot = await asyncio.shield(step)
+                if snapshot is _SENTINEL:
+                    break
+                yield snapshot
+        except asyncio.CancelledError:
+            # Thread tidak bisa dihentikan paksa; tunggu generasi aktif selesai agar close() aman
+            if step is not None and not step.done():
+                await asyncio.wait({step})
+            raise
+        finally:
+            it.close()
+
+    def run(self):
+        """
+        Fungsi utama yang menjalankan proses evolusi dari algoritma genetika.
+        Mengonsumsi stream() dan menyimpan seluruh riwayat generasi.
+        """
+        for snap in self.stream():
+            # Simpan data perkembangan generasi
+            self.best_fitness.append(snap.best_fitness)
+            self.avg_fitness.append(snap.avg_fitness)
+            self.best_solutions.append(snap.best_weights)
+            self.best_returns.append(snap.best_return)
+            self.best_vols.append(snap.best_vol)
 
         # Ambil solusi terbaik sepanjang evolusi
         best_index = np.argmax(self.best_fitness)
@@ -7,8 +7,8 @@ from data import (
 )
 from ga import GeneticAlgorithm
 from analysis import (
-    plot_evolution, display_allocation, display_history,
-    display_weights_by_generation, display_raw_data
+    plot_evolution, plot_evolution_stream, display_allocation, display_history,
+    display_history_stream, display_weights_by_generation, display_raw_data
 )
 
 # === Konfigurasi ===
@@ -81,8 +81,9 @@ def menu():
 7. Rolling Validation
 8. Keluar
 9. Clear Layar
+10. Jalankan Ulang GA (Live)
         """)
-        choice = input("Pilih opsi (1-9): ")
+        choice = input("Pilih opsi (1-10): ")
 
         if choice == '1':
             plot_evolution(ga.best_fitness, ga.avg_fitness)
@@ -111,6 +112,17 @@ def menu():
             break
         elif choice == '9':
             os.system('clear' if os.name == 'posix' else 'cls')
+        elif choice == '10':
+            live_ga = GeneticAlgorithm(exp_returns, cov_matrix, generations=generations)
+            mode = input("Tampilkan sebagai [g]rafik atau [t]eks? ").strip().lower()
+            print("\n⚡ Menjalankan ulang GA secara live (Ctrl+C untuk berhenti lebih awal)...")
+            if mode == 'g':
+                best_snap = plot_evolution_stream(live_ga.stream())
+            else:
+                best_snap = display_history_stream(live_ga.stream())
+            if best_snap is not None:
+                print(f"\nSnapshot terbaik: Generasi ke-{best_snap.generation} (Sharpe {best_snap.best_fitness:.4f})")
+                display_allocation(best_snap.best_weights, tickers=tickers, initial_investment=initial_investment)
         else:
             print("❌ Opsi tidak valid. Coba lagi.")
 